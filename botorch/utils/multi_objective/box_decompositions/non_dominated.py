@@ -217,7 +217,20 @@ class NondominatedPartitioning(BoxDecomposition):
 
     def _get_augmented_pareto_front_indices(self) -> Tensor:
         r"""Get indices of augmented Pareto front."""
-        pf_idx = torch.argsort(self._neg_pareto_Y, dim=-2)
+        if self.num_outcomes == 2:
+            # The Pareto front is already sorted by the first outcome, so the
+            # second outcome is sorted in reverse order and no argsort is needed.
+            # Ties only occur between repeated (padding) points, so their order
+            # does not affect the cell bounds.
+            n_pareto = self._neg_pareto_Y.shape[-2]
+            range_pf = torch.arange(
+                n_pareto, dtype=torch.long, device=self._neg_pareto_Y.device
+            )
+            pf_idx = torch.stack([range_pf, range_pf.flip(0)], dim=-1).expand(
+                *self.batch_shape, n_pareto, 2
+            )
+        else:
+            pf_idx = torch.argsort(self._neg_pareto_Y, dim=-2)
         return torch.cat(
             [
                 torch.zeros(
@@ -346,7 +359,8 @@ class NondominatedPartitioning(BoxDecomposition):
         Note there are much more efficient alternatives for computing
         hypervolume when m > 2 (which do not require partitioning the
         non-dominated space). Given such a partitioning, this method
-        is quite fast.
+        is quite fast. For `m=2` outcomes, the hypervolume is computed
+        directly from the sorted Pareto front.
 
         Returns:
             `(batch_shape)`-dim tensor containing the dominated hypervolume.
@@ -362,6 +376,17 @@ class NondominatedPartitioning(BoxDecomposition):
         )
         # internally we minimize
         ref_point = -ref_point.unsqueeze(-2)
+        if self.num_outcomes == 2:
+            # The Pareto front is sorted by the first outcome, so the dominated
+            # space is the union of the rectangles between each Pareto point and
+            # the next one (or the reference point). Padded Pareto points are
+            # repeated, so their rectangles have zero width.
+            widths = (
+                torch.cat([self._neg_pareto_Y[..., 1:, 0], ref_point[..., 0]], dim=-1)
+                - self._neg_pareto_Y[..., 0]
+            )
+            heights = ref_point[..., 1] - self._neg_pareto_Y[..., 1]
+            return (widths * heights).sum(dim=-1)
         ideal_point = self._neg_pareto_Y.min(dim=-2, keepdim=True).values
         aug_pareto_Y = torch.cat([ideal_point, self._neg_pareto_Y, ref_point], dim=-2)
         cell_bounds_values = self._get_hypercell_bounds(aug_pareto_Y=aug_pareto_Y)
@@ -59,7 +59,6 @@ def _pad_batch_pareto_frontier(
         A `(batch_shape) x max_num_pareto x m`-dim tensor of padded Pareto
             frontiers.
     """
-    tkwargs = {"dtype": Y.dtype, "device": Y.device}
     ref_point = ref_point.unsqueeze(-2)
     batch_shape = Y.shape[:-2]
     if len(batch_shape) > 1:
@@ -71,30 +70,47 @@ def _pad_batch_pareto_frontier(
     if feasibility_mask is not None:
         # set infeasible points to be the reference point (corresponding to the batch)
         Y = torch.where(feasibility_mask.unsqueeze(-1), Y, ref_point)
-    if not is_pareto:
-        pareto_mask = is_non_dominated(Y)
-    else:
-        pareto_mask = torch.ones(Y.shape[:-1], dtype=torch.bool, device=Y.device)
+    # Points that are not better than the reference point cannot dominate any
+    # point that is better than the reference point.
     better_than_ref = (Y > ref_point).all(dim=-1)
-    # is_non_dominated assumes maximization
-    # TODO: filter out points that are worse than the reference point first here
-    pareto_mask = pareto_mask & better_than_ref
     if len(batch_shape) == 0:
-        return Y[pareto_mask]
+        # filter them out before computing the non-dominated points
+        Y = Y[better_than_ref]
+        if is_pareto or Y.shape[-2] == 0:
+            return Y
+        # is_non_dominated assumes maximization
+        return Y[is_non_dominated(Y)]
+    # In the batch case, all points are kept so that the batch shape is
+    # preserved, and the non-dominated points are only computed if at least one
+    # point is better than the reference point.
+    pareto_mask = better_than_ref
+    if not is_pareto and better_than_ref.any():
+        pareto_mask = pareto_mask & is_non_dominated(Y)
     # Note: in the batch case, the Pareto frontier is padded by repeating
     # a Pareto point. This ensures that the padded box-decomposition has
     # the same number of points, which enables fast batch operations.
-    max_n_pareto = pareto_mask.sum(dim=-1).max().item()
-    pareto_Y = torch.empty(*batch_shape, max_n_pareto, Y.shape[-1], **tkwargs)
-    for i, pareto_i in enumerate(pareto_mask):
-        pareto_i = Y[i, pareto_mask[i]]
-        n_pareto = pareto_i.shape[0]
-        if n_pareto > 0:
-            pareto_Y[i, :n_pareto] = pareto_i
-            # pad pareto_Y, so that all batches have the same size Pareto set
-            pareto_Y[i, n_pareto:] = pareto_i[-1]
-        else:
-            # if there are no pareto points in this batch, use the reference
-            # point
-            pareto_Y[i, :] = ref_point[i]
-    return pareto_Y
+    n_pareto = pareto_mask.sum(dim=-1)
+    max_n_pareto = n_pareto.max().item()
+    # position of each Pareto point in the padded Pareto frontier. Dominated
+    # points are written to an extra slot, which is dropped below.
+    pareto_pos = torch.where(
+        pareto_mask,
+        pareto_mask.long().cumsum(dim=-1) - 1,
+        torch.full_like(pareto_mask, max_n_pareto, dtype=torch.long),
+    )
+    pareto_idcs = torch.zeros(
+        *batch_shape, max_n_pareto + 1, dtype=torch.long, device=Y.device
+    ).scatter_(
+        -1,
+        pareto_pos,
+        torch.arange(Y.shape[-2], device=Y.device).expand(pareto_pos.shape),
+    )
+    # pad pareto_Y, so that all batches have the same size Pareto set
+    pad_pos = torch.min(
+        torch.arange(max_n_pareto, device=Y.device),
+        (n_pareto - 1).clamp_min(0).unsqueeze(-1),
+    )
+    pareto_idcs = pareto_idcs.gather(-1, pad_pos)
+    pareto_Y = Y.gather(-2, pareto_idcs.unsqueeze(-1).expand(-1, -1, Y.shape[-1]))
+    # if there are no pareto points in this batch, use the reference point
+    return torch.where((n_pareto > 0).view(-1, 1, 1), pareto_Y, ref_point)
@@ -15,6 +15,10 @@ def is_non_dominated(Y: Tensor, deduplicate: bool = True) -> Tensor:
 
     Note: this assumes maximization.
 
+    For `m=2` outcomes with more than 32 single or double precision points
+    and without NaNs, this uses an `O(n log n)` sort-based algorithm.
+    Otherwise, all pairs of points are compared, which is faster for small `n`.
+
     Args:
         Y: A `(batch_shape) x n x m`-dim tensor of outcomes.
         deduplicate: A boolean indicating whether to only return
@@ -24,6 +28,14 @@ def is_non_dominated(Y: Tensor, deduplicate: bool = True) -> Tensor:
         A `(batch_shape) x n`-dim boolean tensor indicating whether
         each point is non-dominated.
     """
+    if (
+        Y.shape[-1] == 2
+        and Y.shape[-2] > 32
+        # cummax is not implemented for all dtypes (e.g. half on CPU)
+        and Y.dtype in (torch.float, torch.double)
+        and not torch.isnan(Y).any()
+    ):
+        return _is_non_dominated_2d(Y=Y, deduplicate=deduplicate)
     Y1 = Y.unsqueeze(-3)
     Y2 = Y.unsqueeze(-2)
     dominates = (Y1 >= Y2).all(dim=-1) & (Y1 > Y2).any(dim=-1)
@@ -36,3 +48,59 @@ def is_non_dominated(Y: Tensor, deduplicate: bool = True) -> Tensor:
         keep.scatter_(dim=-1, index=indices, value=1.0)
         return nd_mask & keep
     return nd_mask
+
+
+def _is_non_dominated_2d(Y: Tensor, deduplicate: bool = True) -> Tensor:
+    r"""Computes the non-dominated front for two outcomes.
+
+    The points are sorted by the first outcome in descending order. A point is
+    then non-dominated if its second outcome is strictly greater than that of
+    every point with a strictly greater first outcome, and at least as large as
+    that of every point with the same first outcome.
+
+    Note: this assumes maximization.
+
+    Args:
+        Y: A `(batch_shape) x n x 2`-dim floating point tensor of outcomes
+            without NaNs, with `n > 0`.
+        deduplicate: A boolean indicating whether to only return
+            unique points on the pareto frontier.
+
+    Returns:
+        A `(batch_shape) x n`-dim boolean tensor indicating whether
+        each point is non-dominated.
+    """
+    n = Y.shape[-2]
+    order = torch.argsort(Y[..., 0], dim=-1, descending=True)
+    y0 = Y[..., 0].gather(-1, order)
+    y1 = Y[..., 1].gather(-1, order)
+    arange = torch.arange(n, dtype=torch.long, device=Y.device).expand(order.shape)
+    # points with tied first outcomes form contiguous blocks after sorting
+    is_tied = y0[..., 1:] == y0[..., :-1]
+    is_first = torch.ones(*Y.shape[:-2], 1, dtype=torch.bool, device=Y.device)
+    is_block_start = torch.cat([is_first, ~is_tied], dim=-1)
+    is_block_end = torch.cat([~is_tied, is_first], dim=-1)
+    # position of the first / last point of the block containing each point
+    block_start = torch.where(is_block_start, arange, torch.zeros_like(arange))
+    block_start = block_start.cummax(dim=-1).values
+    block_end = torch.where(is_block_end, arange, torch.full_like(arange, n - 1))
+    block_end = block_end.flip(-1).cummin(dim=-1).values.flip(-1)
+    running_max = y1.cummax(dim=-1).values
+    # largest second outcome among points with a strictly greater first outcome
+    prev_max = torch.cat(
+        [torch.full_like(running_max[..., :1], float("-inf")), running_max[..., :-1]],
+        dim=-1,
+    ).gather(-1, block_start)
+    # the first block has no predecessors (prev_max is only a sentinel there)
+    nd_mask = ((block_start == 0) | (y1 > prev_max)) & (
+        y1 >= running_max.gather(-1, block_end)
+    )
+    if deduplicate:
+        # non-dominated points in the same block are duplicates of one another;
+        # keep the one that occurs first in `Y`. Offsetting by the block start
+        # makes the running max over the keys a max within each block.
+        keys = block_start * (n + 1) + torch.where(
+            nd_mask, n - order, torch.zeros_like(order)
+        )
+        nd_mask = nd_mask & (keys == keys.cummax(dim=-1).values.gather(-1, block_end))
+    return torch.zeros_like(nd_mask).scatter(-1, order, nd_mask)
@@ -6,18 +6,98 @@
 
 from __future__ import annotations
 
+import os
+
 import torch
 from botorch.exceptions.errors import BotorchError, BotorchTensorDimensionError
 from botorch.utils.multi_objective.box_decompositions.non_dominated import (
     NondominatedPartitioning,
 )
+from botorch.utils.multi_objective.hypervolume import Hypervolume
 from botorch.utils.testing import BotorchTestCase
 
 
+# set BOTORCH_TEST_FAST to only run the tests in double precision
+DTYPES = (
+    (torch.double,)
+    if os.environ.get("BOTORCH_TEST_FAST")
+    else (torch.float, torch.double)
+)
+# random outcomes for the batched m=2 tests, seeded for reproducibility
+Y_BATCH_M2 = torch.rand(
+    3, 10, 2, generator=torch.Generator().manual_seed(0), dtype=torch.double
+)
+inf = float("inf")
+# expected cell bounds for the m=2 test problem
+EXPECTED_CELL_BOUNDS_M2 = torch.tensor(
+    [
+        [
+            [8.0, 0.0],
+            [7.0, 3.0],
+            [6.0, 4.0],
+            [5.0, 5.0],
+            [4.0, 6.0],
+            [3.0, 7.0],
+            [0.0, 8.0],
+        ],
+        [
+            [inf, inf],
+            [8.0, inf],
+            [7.0, inf],
+            [6.0, inf],
+            [5.0, inf],
+            [4.0, inf],
+            [3.0, inf],
+        ],
+    ],
+    dtype=torch.double,
+)
+PARETO_Y_M3 = torch.tensor(
+    [[1.0, 6.0, 8.0], [2.0, 4.0, 10.0], [3.0, 5.0, 7.0]], dtype=torch.double
+)
+REF_POINT_M3 = torch.tensor([-1.0, -2.0, -3.0], dtype=torch.double)
+# expected cell bounds for the m=3 test problem
+EXPECTED_CELL_BOUNDS_M3 = torch.tensor(
+    [
+        [
+            [1.0, 4.0, 7.0],
+            [-1.0, -2.0, 10.0],
+            [-1.0, 4.0, 8.0],
+            [1.0, -2.0, 10.0],
+            [1.0, 4.0, 8.0],
+            [-1.0, 6.0, -3.0],
+            [1.0, 5.0, -3.0],
+            [-1.0, 5.0, 8.0],
+            [2.0, -2.0, 7.0],
+            [2.0, 4.0, 7.0],
+            [3.0, -2.0, -3.0],
+            [2.0, -2.0, 8.0],
+            [2.0, 5.0, -3.0],
+        ],
+        [
+            [2.0, 5.0, 8.0],
+            [1.0, 4.0, inf],
+            [1.0, 5.0, inf],
+            [2.0, 4.0, inf],
+            [2.0, 5.0, inf],
+            [1.0, inf, 8.0],
+            [2.0, inf, 8.0],
+            [2.0, inf, inf],
+            [3.0, 4.0, 8.0],
+            [3.0, 5.0, 8.0],
+            [inf, 5.0, 8.0],
+            [inf, 5.0, inf],
+            [inf, inf, inf],
+        ],
+    ],
+    dtype=torch.double,
+)
+
+
 class TestNonDominatedPartitioning(BotorchTestCase):
     def test_non_dominated_partitioning(self):
         tkwargs = {"device": self.device}
-        for dtype in (torch.float, torch.double):
+        for dtype in DTYPES:
             tkwargs["dtype"] = dtype
             ref_point = torch.zeros(2, **tkwargs)
             partitioning = NondominatedPartitioning(ref_point=ref_point)
@@ -33,45 +113,21 @@ class TestNonDominatedPartitioning(BotorchTestCase):
             partitioning.batch_shape = torch.Size([])
             self.assertFalse(partitioning._update_pareto_Y())
 
-            # test m=2
-            arange = torch.arange(3, 9, **tkwargs)
-            pareto_Y = torch.stack([arange, 11 - arange], dim=-1)
-            Y = torch.cat(
-                [
-                    pareto_Y,
-                    torch.tensor(
-                        [[8.0, 2.0], [7.0, 1.0]], **tkwargs
-                    ),  # add some non-pareto elements
-                ],
-                dim=0,
-            )
+    def test_non_dominated_partitioning_m2(self):
+        tkwargs = {"device": self.device}
+        for dtype in DTYPES:
+            tkwargs["dtype"] = dtype
+            ref_point = torch.zeros(2, **tkwargs)
+            Y = torch.empty(8, 2, **tkwargs)
+            Y[:6, 0] = torch.arange(3, 9, **tkwargs)
+            Y[:6, 1] = 11 - Y[:6, 0]
+            # add some non-pareto elements
+            Y[6:] = torch.tensor([[8.0, 2.0], [7.0, 1.0]], **tkwargs)
+            pareto_Y = Y[:6]
             partitioning = NondominatedPartitioning(ref_point=ref_point, Y=Y)
             sorting = torch.argsort(pareto_Y[:, 0], descending=True)
             self.assertTrue(torch.equal(pareto_Y[sorting], partitioning.pareto_Y))
-            inf = float("inf")
-            expected_cell_bounds = torch.tensor(
-                [
-                    [
-                        [8.0, 0.0],
-                        [7.0, 3.0],
-                        [6.0, 4.0],
-                        [5.0, 5.0],
-                        [4.0, 6.0],
-                        [3.0, 7.0],
-                        [0.0, 8.0],
-                    ],
-                    [
-                        [inf, inf],
-                        [8.0, inf],
-                        [7.0, inf],
-                        [6.0, inf],
-                        [5.0, inf],
-                        [4.0, inf],
-                        [3.0, inf],
-                    ],
-                ],
-                **tkwargs,
-            )
+            expected_cell_bounds = EXPECTED_CELL_BOUNDS_M2.to(**tkwargs)
             cell_bounds = partitioning.get_hypercell_bounds()
             self.assertTrue(torch.equal(cell_bounds, expected_cell_bounds))
             # test compute hypervolume
@@ -84,7 +140,12 @@ class TestNonDominatedPartitioning(BotorchTestCase):
             self.assertTrue(torch.equal(partitioning.pareto_Y, Y[:0]))
             self.assertEqual(partitioning.compute_hypervolume().item(), 0)
 
-            Y = torch.rand(3, 10, 2, **tkwargs)
+    def test_non_dominated_partitioning_batched_m2(self):
+        tkwargs = {"device": self.device}
+        for dtype in DTYPES:
+            tkwargs["dtype"] = dtype
+            ref_point = torch.zeros(2, **tkwargs)
+            Y = Y_BATCH_M2.to(**tkwargs)
             # test batched m=2, no pareto points better than the reference point
             partitioning = NondominatedPartitioning(
                 ref_point=Y.max(dim=-2).values + 1, Y=Y
@@ -103,10 +164,13 @@ class TestNonDominatedPartitioning(BotorchTestCase):
             for i in range(Y.shape[0]):
                 partitioning_i = NondominatedPartitioning(ref_point=ref_point, Y=Y[i])
                 partitionings.append(partitioning_i)
-                # check pareto_Y
-                pareto_set1 = {tuple(x) for x in partitioning_i.pareto_Y.tolist()}
-                pareto_set2 = {tuple(x) for x in partitioning.pareto_Y[i].tolist()}
-                self.assertEqual(pareto_set1, pareto_set2)
+                # check pareto_Y (unique sorts the rows and removes the padding)
+                self.assertTrue(
+                    torch.equal(
+                        torch.unique(partitioning_i.pareto_Y, dim=0),
+                        torch.unique(partitioning.pareto_Y[i], dim=0),
+                    )
+                )
                 expected_cell_bounds_i = partitioning_i.get_hypercell_bounds()
                 # remove padding
                 no_padding_cell_bounds_i = cell_bounds[:, i][
@@ -116,10 +180,6 @@ class TestNonDominatedPartitioning(BotorchTestCase):
                     torch.equal(expected_cell_bounds_i, no_padding_cell_bounds_i)
                 )
 
-            # test improper Y shape (too many batch dims)
-            with self.assertRaises(NotImplementedError):
-                NondominatedPartitioning(ref_point=ref_point, Y=Y.unsqueeze(0))
-
             # test batched compute_hypervolume, m=2
             hvs = partitioning.compute_hypervolume()
             hvs_non_batch = torch.stack(
@@ -130,6 +190,22 @@ class TestNonDominatedPartitioning(BotorchTestCase):
                 dim=0,
             )
             self.assertTrue(torch.allclose(hvs, hvs_non_batch))
+            # compare with the dimension sweep algorithm
+            hv = Hypervolume(ref_point=ref_point)
+            expected_hvs = torch.tensor(
+                [hv.compute(p_i.pareto_Y) for p_i in partitionings], **tkwargs
+            )
+            self.assertTrue(torch.allclose(hvs, expected_hvs))
+
+    def test_non_dominated_partitioning_errors(self):
+        tkwargs = {"device": self.device}
+        for dtype in DTYPES:
+            tkwargs["dtype"] = dtype
+            ref_point = torch.zeros(2, **tkwargs)
+            Y = Y_BATCH_M2.to(**tkwargs)
+            # test improper Y shape (too many batch dims)
+            with self.assertRaises(NotImplementedError):
+                NondominatedPartitioning(ref_point=ref_point, Y=Y.unsqueeze(0))
 
             # test batched m>2
             ref_point = torch.zeros(3, **tkwargs)
@@ -144,59 +220,28 @@ class TestNonDominatedPartitioning(BotorchTestCase):
             )
             with self.assertRaises(BotorchTensorDimensionError):
                 partitioning.partition_space_2d()
-            # test m=3
-            pareto_Y = torch.tensor(
-                [[1.0, 6.0, 8.0], [2.0, 4.0, 10.0], [3.0, 5.0, 7.0]], **tkwargs
-            )
-            ref_point = torch.tensor([-1.0, -2.0, -3.0], **tkwargs)
+
+    def test_non_dominated_partitioning_m3(self):
+        tkwargs = {"device": self.device}
+        for dtype in DTYPES:
+            tkwargs["dtype"] = dtype
+            pareto_Y = PARETO_Y_M3.to(**tkwargs)
+            ref_point = REF_POINT_M3.to(**tkwargs)
             partitioning = NondominatedPartitioning(ref_point=ref_point, Y=pareto_Y)
             sorting = torch.argsort(pareto_Y[:, 0], descending=True)
             self.assertTrue(torch.equal(pareto_Y[sorting], partitioning.pareto_Y))
 
-            expected_cell_bounds = torch.tensor(
-                [
-                    [
-                        [1.0, 4.0, 7.0],
-                        [-1.0, -2.0, 10.0],
-                        [-1.0, 4.0, 8.0],
-                        [1.0, -2.0, 10.0],
-                        [1.0, 4.0, 8.0],
-                        [-1.0, 6.0, -3.0],
-                        [1.0, 5.0, -3.0],
-                        [-1.0, 5.0, 8.0],
-                        [2.0, -2.0, 7.0],
-                        [2.0, 4.0, 7.0],
-                        [3.0, -2.0, -3.0],
-                        [2.0, -2.0, 8.0],
-                        [2.0, 5.0, -3.0],
-                    ],
-                    [
-                        [2.0, 5.0, 8.0],
-                        [1.0, 4.0, inf],
-                        [1.0, 5.0, inf],
-                        [2.0, 4.0, inf],
-                        [2.0, 5.0, inf],
-                        [1.0, inf, 8.0],
-                        [2.0, inf, 8.0],
-                        [2.0, inf, inf],
-                        [3.0, 4.0, 8.0],
-                        [3.0, 5.0, 8.0],
-                        [inf, 5.0, 8.0],
-                        [inf, 5.0, inf],
-                        [inf, inf, inf],
-                    ],
-                ],
-                **tkwargs,
-            )
+            expected_cell_bounds = EXPECTED_CELL_BOUNDS_M3.to(**tkwargs)
             cell_bounds = partitioning.get_hypercell_bounds()
-            # cell bounds can have different order
-            num_matches = (
-                (cell_bounds.unsqueeze(0) == expected_cell_bounds.unsqueeze(1))
-                .all(dim=-1)
-                .any(dim=0)
-                .sum()
+            # cell bounds can have different order, so compare the sorted cells
+            self.assertTrue(
+                torch.equal(
+                    torch.unique(cell_bounds.transpose(0, 1).reshape(-1, 6), dim=0),
+                    torch.unique(
+                        expected_cell_bounds.transpose(0, 1).reshape(-1, 6), dim=0
+                    ),
+                )
             )
-            self.assertTrue(num_matches, 9)
             # test compute hypervolume
             hv = partitioning.compute_hypervolume()
             self.assertEqual(hv.item(), 358.0)
@@ -43,6 +43,7 @@ class TestExpandRefPoint(BotorchTestCase):
 class TestPadBatchParetoFrontier(BotorchTestCase):
     def test_pad_batch_pareto_frontier(self):
         for dtype in (torch.float, torch.double):
+            tkwargs = {"dtype": dtype, "device": self.device}
             Y1 = torch.tensor(
                 [
                     [1.0, 5.0],
@@ -99,6 +100,27 @@ class TestPadBatchParetoFrontier(BotorchTestCase):
                 [expected_nondom_Y1, expected_padded_nondom_Y2], dim=0
             )
             self.assertTrue(torch.equal(padded_pareto, expected_padded_pareto))
+            # test non-batch
+            pareto_Y1 = _pad_batch_pareto_frontier(
+                Y=Y1, ref_point=ref_point[0], is_pareto=False
+            )
+            self.assertTrue(torch.equal(pareto_Y1, expected_nondom_Y1))
+            # test no points better than the reference point
+            pareto_Y1 = _pad_batch_pareto_frontier(
+                Y=Y1, ref_point=ref_point[0] + 10.0, is_pareto=False
+            )
+            self.assertTrue(torch.equal(pareto_Y1, Y1[:0]))
+            # test exactly one point better than the reference point
+            pareto_Y1 = _pad_batch_pareto_frontier(
+                Y=Y1, ref_point=torch.tensor([9.5, 2.0], **tkwargs), is_pareto=False
+            )
+            self.assertTrue(torch.equal(pareto_Y1, Y1[1:2]))
+            pareto_Y = _pad_batch_pareto_frontier(
+                Y=torch.stack([Y1, Y1], dim=0),
+                ref_point=torch.tensor([9.5, 2.0], **tkwargs).expand(2, -1),
+                is_pareto=False,
+            )
+            self.assertTrue(torch.equal(pareto_Y, Y1[1:2].expand(2, -1, -1)))
 
             # test feasibility mask
             feas = (Y >= 9.0).any(dim=-1)
@@ -150,6 +172,21 @@ class TestPadBatchParetoFrontier(BotorchTestCase):
             )
             self.assertTrue(torch.equal(padded_pareto, expected_padded_pareto))
 
+            # test batch with no points better than the reference point
+            ref_point2 = ref_point.clone()
+            ref_point2[1] = 10.0
+            expected_padded_pareto = torch.stack(
+                [
+                    Y1,
+                    ref_point2[1:].expand(3, -1),
+                ],
+                dim=0,
+            )
+            padded_pareto = _pad_batch_pareto_frontier(
+                Y=Y, ref_point=ref_point2, is_pareto=True
+            )
+            self.assertTrue(torch.equal(padded_pareto, expected_padded_pareto))
+
         # test multiple batch dims
         with self.assertRaises(UnsupportedError):
             _pad_batch_pareto_frontier(
@@ -7,8 +7,12 @@
 from __future__ import annotations
 
 import torch
-from botorch.utils.multi_objective.pareto import is_non_dominated
+from botorch.utils.multi_objective.pareto import (
+    _is_non_dominated_2d,
+    is_non_dominated,
+)
 from botorch.utils.testing import BotorchTestCase
+from torch import Tensor
 
 
 class TestPareto(BotorchTestCase):
@@ -122,3 +126,88 @@ class TestPareto(BotorchTestCase):
             self.assertTrue(
                 torch.equal(batch_Y3[1][nondom_mask3[1]], expected_nondom_Y3b_no_dedup)
             )
+
+    def test_is_non_dominated_2d(self) -> None:
+        tkwargs = {"device": self.device}
+        for dtype in (torch.float, torch.double):
+            tkwargs["dtype"] = dtype
+            # use a coarse grid so that there are many ties and duplicates, and
+            # enough points to use the sort-based algorithm
+            Y = torch.randint(5, (3, 50, 2), **tkwargs)
+            for deduplicate in (True, False):
+                expected_nd_mask = _pairwise_is_non_dominated(Y, deduplicate)
+                self.assertTrue(
+                    torch.equal(
+                        is_non_dominated(Y, deduplicate=deduplicate), expected_nd_mask
+                    )
+                )
+                # test non-batch
+                self.assertTrue(
+                    torch.equal(
+                        is_non_dominated(Y[0], deduplicate=deduplicate),
+                        expected_nd_mask[0],
+                    )
+                )
+                # test small inputs
+                self.assertTrue(
+                    torch.equal(
+                        _is_non_dominated_2d(Y[:, :5], deduplicate=deduplicate),
+                        _pairwise_is_non_dominated(Y[:, :5], deduplicate),
+                    )
+                )
+            # test empty
+            nd_mask = is_non_dominated(Y[:, :0], deduplicate=False)
+            self.assertEqual(nd_mask.shape, torch.Size([3, 0]))
+            # test single point
+            for batch_shape in (torch.Size([]), torch.Size([3])):
+                Y1 = torch.ones(*batch_shape, 1, 2, **tkwargs)
+                expected_nd_mask = torch.ones(
+                    *batch_shape, 1, dtype=torch.bool, device=self.device
+                )
+                for deduplicate in (True, False):
+                    self.assertTrue(
+                        torch.equal(
+                            _is_non_dominated_2d(Y1, deduplicate=deduplicate),
+                            expected_nd_mask,
+                        )
+                    )
+            # test infinite second outcome
+            Y1 = torch.tensor([[1.0, float("-inf")], [0.0, float("-inf")]], **tkwargs)
+            expected_nd_mask = torch.tensor([True, False], device=self.device)
+            for deduplicate in (True, False):
+                self.assertTrue(
+                    torch.equal(
+                        _is_non_dominated_2d(Y1, deduplicate=deduplicate),
+                        expected_nd_mask,
+                    )
+                )
+            # test NaN (uses pairwise comparisons)
+            Y_nan = Y[0].clone()
+            Y_nan[0, 0] = float("nan")
+            for deduplicate in (True, False):
+                self.assertTrue(
+                    torch.equal(
+                        is_non_dominated(Y_nan, deduplicate=deduplicate),
+                        _pairwise_is_non_dominated(Y_nan, deduplicate),
+                    )
+                )
+        # test integer and half precision outcomes (uses pairwise comparisons)
+        for dtype in (torch.long, torch.half):
+            Y_other = Y[0].to(dtype=dtype)
+            self.assertTrue(
+                torch.equal(is_non_dominated(Y_other), is_non_dominated(Y[0]))
+            )
+
+
+def _pairwise_is_non_dominated(Y: Tensor, deduplicate: bool) -> Tensor:
+    r"""Computes the non-dominated front by comparing all pairs of points."""
+    Y1 = Y.unsqueeze(-3)
+    Y2 = Y.unsqueeze(-2)
+    dominates = (Y1 >= Y2).all(dim=-1) & (Y1 > Y2).any(dim=-1)
+    nd_mask = ~(dominates.any(dim=-1))
+    if deduplicate:
+        indices = (Y1 == Y2).all(dim=-1).long().argmax(dim=-1)
+        keep = torch.zeros_like(nd_mask)
+        keep.scatter_(dim=-1, index=indices, value=1.0)
+        return nd_mask & keep
+    return nd_mask